@@ -173,6 +173,8 @@ rst_epilog = """
 
 .. |Section| replace:: :class:`.Section`
 
+.. |SectionSnapshot| replace:: :class:`.SectionSnapshot`
+
 .. |Sections| replace:: :class:`.Sections`
 
 .. |Settings| replace:: :class:`.Settings`
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, List
+from typing import TYPE_CHECKING, Callable, List, cast
 
+from lxml import etree
+
+from docx.oxml.ns import nsmap
 from docx.oxml.section import CT_SectPr
 from docx.oxml.xmlchemy import BaseOxmlElement, ZeroOrMore, ZeroOrOne
 
@@ -11,12 +14,25 @@ if TYPE_CHECKING:
     from docx.oxml.table import CT_Tbl
     from docx.oxml.text.paragraph import CT_P
 
+# -- `w:sectPr` elements directly accessible from the document element --
+_sectPr_lst_xpath_str = "./w:body/w:p/w:pPr/w:sectPr | ./w:body/w:sectPr"
+_sectPr_count_xpath = etree.XPath(f"count({_sectPr_lst_xpath_str})", namespaces=nsmap, regexp=False)
+
 
 class CT_Document(BaseOxmlElement):
     """``<w:document>`` element, the root element of a document.xml file."""
 
     body: CT_Body = ZeroOrOne("w:body")  # pyright: ignore[reportAssignmentType]
 
+    @property
+    def sectPr_count(self) -> int:
+        """Count of the `w:sectPr` elements in `.sectPr_lst`.
+
+        The count is computed in XPath, without constructing the list.
+        """
+        # -- numeric XPath results are always float, so need an int() conversion --
+        return int(cast(float, _sectPr_count_xpath(self)))
+
     @property
     def sectPr_lst(self) -> List[CT_SectPr]:
         """All `w:sectPr` elements directly accessible from document element.
@@ -28,8 +44,7 @@ class CT_Document(BaseOxmlElement):
         `w:sectPr` elements appear in document order. The last one is always
         `w:body/w:sectPr`, all preceding are `w:p/w:pPr/w:sectPr`.
         """
-        xpath = "./w:body/w:p/w:pPr/w:sectPr | ./w:body/w:sectPr"
-        return self.xpath(xpath)
+        return self.xpath(_sectPr_lst_xpath_str)
 
 
 class CT_Body(BaseOxmlElement):
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Callable, Iterator, List, Sequence, cast
+from typing import Callable, Iterator, List, NamedTuple, Sequence, cast
 
 from lxml import etree
 from typing_extensions import TypeAlias
 
 from docx.enum.section import WD_HEADER_FOOTER, WD_ORIENTATION, WD_SECTION_START
-from docx.oxml.ns import nsmap
+from docx.oxml.ns import nsmap, qn
 from docx.oxml.shared import CT_OnOff
 from docx.oxml.simpletypes import ST_SignedTwipsMeasure, ST_TwipsMeasure, XsdString
 from docx.oxml.table import CT_Tbl
@@ -25,6 +25,28 @@ from docx.shared import Length, lazyproperty
 
 BlockElement: TypeAlias = "CT_P | CT_Tbl"
 
+# -- compiled once rather than parsed on each `.preceding_sectPr` access --
+_preceding_sectPr_xpath = etree.XPath("./preceding::w:sectPr[1]", namespaces=nsmap, regexp=False)
+
+
+class PageSettings(NamedTuple):
+    """Page-size and page-margin values of a `w:sectPr`, from `CT_SectPr.page_settings`.
+
+    Each value is the same as that of the like-named `CT_SectPr` property, except that
+    `header_distance` and `footer_distance` are those of `.header` and `.footer`.
+    """
+
+    orientation: WD_ORIENTATION
+    page_width: Length | None
+    page_height: Length | None
+    top_margin: Length | None
+    bottom_margin: Length | None
+    left_margin: Length | None
+    right_margin: Length | None
+    gutter: Length | None
+    header_distance: Length | None
+    footer_distance: Length | None
+
 
 class CT_HdrFtr(BaseOxmlElement):
     """`w:hdr` and `w:ftr`, the root element for header and footer part respectively."""
@@ -213,20 +235,11 @@ class CT_SectPr(BaseOxmlElement):
 
     def get_footerReference(self, type_: WD_HEADER_FOOTER) -> CT_HdrFtrRef | None:
         """Return footerReference element of `type_` or None if not present."""
-        path = "./w:footerReference[@w:type='%s']" % WD_HEADER_FOOTER.to_xml(type_)
-        footerReferences = self.xpath(path)
-        if not footerReferences:
-            return None
-        return footerReferences[0]
+        return self._first_child_of_type("w:footerReference", type_)
 
     def get_headerReference(self, type_: WD_HEADER_FOOTER) -> CT_HdrFtrRef | None:
         """Return headerReference element of `type_` or None if not present."""
-        matching_headerReferences = self.xpath(
-            "./w:headerReference[@w:type='%s']" % WD_HEADER_FOOTER.to_xml(type_)
-        )
-        if len(matching_headerReferences) == 0:
-            return None
-        return matching_headerReferences[0]
+        return self._first_child_of_type("w:headerReference", type_)
 
     @property
     def gutter(self) -> Length | None:
@@ -332,12 +345,32 @@ class CT_SectPr(BaseOxmlElement):
         pgSz = self.get_or_add_pgSz()
         pgSz.w = value
 
+    @property
+    def page_settings(self) -> PageSettings:
+        """|PageSettings| holding the page-size and page-margin values of this section.
+
+        `w:pgSz` and `w:pgMar` are each located once, rather than once for each value.
+        """
+        pgSz, pgMar = self.pgSz, self.pgMar
+        return PageSettings(
+            orientation=WD_ORIENTATION.PORTRAIT if pgSz is None else pgSz.orient,
+            page_width=None if pgSz is None else pgSz.w,
+            page_height=None if pgSz is None else pgSz.h,
+            top_margin=None if pgMar is None else pgMar.top,
+            bottom_margin=None if pgMar is None else pgMar.bottom,
+            left_margin=None if pgMar is None else pgMar.left,
+            right_margin=None if pgMar is None else pgMar.right,
+            gutter=None if pgMar is None else pgMar.gutter,
+            header_distance=None if pgMar is None else pgMar.header,
+            footer_distance=None if pgMar is None else pgMar.footer,
+        )
+
     @property
     def preceding_sectPr(self) -> CT_SectPr | None:
         """SectPr immediately preceding this one or None if this is the first."""
         # -- [1] predicate returns list of zero or one value --
-        preceding_sectPrs = self.xpath("./preceding::w:sectPr[1]")
-        return preceding_sectPrs[0] if len(preceding_sectPrs) > 0 else None
+        preceding_sectPrs = cast(List[CT_SectPr], _preceding_sectPr_xpath(self))
+        return preceding_sectPrs[0] if preceding_sectPrs else None
 
     def remove_footerReference(self, type_: WD_HEADER_FOOTER) -> str:
         """Return rId of w:footerReference child of `type_` after removing it."""
@@ -422,6 +455,16 @@ class CT_SectPr(BaseOxmlElement):
         pgMar = self.get_or_add_pgMar()
         pgMar.top = value
 
+    def _first_child_of_type(self, tagname: str, type_: WD_HEADER_FOOTER) -> CT_HdrFtrRef | None:
+        """First `tagname` child having `w:type` of `type_`, or None if not present."""
+        # -- a direct scan of the children stops at the first match and so is cheaper than
+        # -- an XPath query, which always computes the complete result set
+        type_attr, xml_value = qn("w:type"), type_.xml_value
+        for child in self.iterchildren(qn(tagname)):
+            if child.get(type_attr) == xml_value:
+                return cast(CT_HdrFtrRef, child)
+        return None
+
 
 class CT_SectType(BaseOxmlElement):
     """``<w:sectType>`` element, defining the section start type."""
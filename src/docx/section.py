@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, List, Sequence, overload
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+    overload,
+)
 
 from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_HEADER_FOOTER
 from docx.oxml.text.paragraph import CT_P
 from docx.parts.hdrftr import FooterPart, HeaderPart
-from docx.shared import lazyproperty
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 
 if TYPE_CHECKING:
     from docx.enum.section import WD_ORIENTATION, WD_SECTION_START
     from docx.oxml.document import CT_Document
-    from docx.oxml.section import CT_SectPr
+    from docx.oxml.section import CT_HdrFtrRef, CT_SectPr
     from docx.parts.document import DocumentPart
     from docx.parts.story import StoryPart
     from docx.shared import Length
@@ -27,10 +41,15 @@ class Section:
     Also provides access to headers and footers.
     """
 
+    __slots__ = ("_sectPr", "_document_part", "_footer", "_header")
+
     def __init__(self, sectPr: CT_SectPr, document_part: DocumentPart):
         super(Section, self).__init__()
         self._sectPr = sectPr
         self._document_part = document_part
+        # -- default header and footer are constructed on first access --
+        self._footer: _Footer | None = None
+        self._header: _Header | None = None
 
     @property
     def bottom_margin(self) -> Length | None:
@@ -94,14 +113,19 @@ class Section:
         """
         return _Header(self._sectPr, self._document_part, WD_HEADER_FOOTER.FIRST_PAGE)
 
-    @lazyproperty
+    @property
     def footer(self) -> _Footer:
         """|_Footer| object representing default page footer for this section.
 
         The default footer is used for odd-numbered pages when separate odd/even footers
         are enabled. It is used for both odd and even-numbered pages otherwise.
         """
-        return _Footer(self._sectPr, self._document_part, WD_HEADER_FOOTER.PRIMARY)
+        footer = self._footer
+        if footer is None:
+            footer = self._footer = _Footer(
+                self._sectPr, self._document_part, WD_HEADER_FOOTER.PRIMARY
+            )
+        return footer
 
     @property
     def footer_distance(self) -> Length | None:
@@ -132,14 +156,19 @@ class Section:
     def gutter(self, value: int | Length | None):
         self._sectPr.gutter = value
 
-    @lazyproperty
+    @property
     def header(self) -> _Header:
         """|_Header| object representing default page header for this section.
 
         The default header is used for odd-numbered pages when separate odd/even headers
         are enabled. It is used for both odd and even-numbered pages otherwise.
         """
-        return _Header(self._sectPr, self._document_part, WD_HEADER_FOOTER.PRIMARY)
+        header = self._header
+        if header is None:
+            header = self._header = _Header(
+                self._sectPr, self._document_part, WD_HEADER_FOOTER.PRIMARY
+            )
+        return header
 
     @property
     def header_distance(self) -> Length | None:
@@ -253,12 +282,60 @@ class Section:
         self._sectPr.top_margin = value
 
 
+# -- getter for each Section page-setup property, reading the same value from a sectPr --
+_sectPr_getters: Dict[str, Callable[[CT_SectPr], Any]] = {
+    name: attrgetter(sectPr_name)
+    for name, sectPr_name in (
+        ("bottom_margin", "bottom_margin"),
+        ("different_first_page_header_footer", "titlePg_val"),
+        ("footer_distance", "footer"),
+        ("gutter", "gutter"),
+        ("header_distance", "header"),
+        ("left_margin", "left_margin"),
+        ("orientation", "orientation"),
+        ("page_height", "page_height"),
+        ("page_width", "page_width"),
+        ("right_margin", "right_margin"),
+        ("start_type", "start_type"),
+        ("top_margin", "top_margin"),
+    )
+}
+
+
+class SectionSnapshot(NamedTuple):
+    """Values of a section captured by :meth:`.Sections.snapshot`.
+
+    Page-setting fields have the same name and value as the corresponding |Section|
+    property, but are read directly from the section's `w:pgSz` and `w:pgMar` elements.
+    `header` and `footer` are the effective default header and footer, as generated by
+    :meth:`.Sections.iter_effective_headers` and :meth:`.Sections.iter_effective_footers`.
+    Values are captured when the snapshot is taken and do not reflect later changes to
+    the document.
+    """
+
+    section: Section
+    header: _Header | None
+    footer: _Footer | None
+    orientation: WD_ORIENTATION
+    page_width: Length | None
+    page_height: Length | None
+    top_margin: Length | None
+    bottom_margin: Length | None
+    left_margin: Length | None
+    right_margin: Length | None
+    gutter: Length | None
+    header_distance: Length | None
+    footer_distance: Length | None
+
+
 class Sections(Sequence[Section]):
     """Sequence of |Section| objects corresponding to the sections in the document.
 
     Supports ``len()``, iteration, and indexed access.
     """
 
+    __slots__ = ("_document_elm", "_document_part")
+
     def __init__(self, document_elm: CT_Document, document_part: DocumentPart):
         super(Sections, self).__init__()
         self._document_elm = document_elm
@@ -271,24 +348,105 @@ class Sections(Sequence[Section]):
     def __getitem__(self, key: slice) -> List[Section]: ...
 
     def __getitem__(self, key: int | slice) -> Section | List[Section]:
+        # -- `.sectPr_lst` is an XPath query, evaluate it once per call --
+        sectPr_lst, document_part = self._document_elm.sectPr_lst, self._document_part
         if isinstance(key, slice):
-            return [
-                Section(sectPr, self._document_part)
-                for sectPr in self._document_elm.sectPr_lst[key]
-            ]
-        return Section(self._document_elm.sectPr_lst[key], self._document_part)
+            return [Section(sectPr, document_part) for sectPr in sectPr_lst[key]]
+        return Section(sectPr_lst[key], document_part)
 
     def __iter__(self) -> Iterator[Section]:
+        document_part = self._document_part
         for sectPr in self._document_elm.sectPr_lst:
-            yield Section(sectPr, self._document_part)
+            yield Section(sectPr, document_part)
 
     def __len__(self) -> int:
-        return len(self._document_elm.sectPr_lst)
+        return self._document_elm.sectPr_count
+
+    def iter_effective_footers(self) -> Iterator[Tuple[Section, _Footer | None]]:
+        """Generate a `(section, footer)` pair for each section in this document.
+
+        `footer` is the default |_Footer| whose content appears in `section`. This is
+        `section.footer` when that footer has its own definition, otherwise the footer of
+        the nearest prior section that has one. `footer` is |None| when neither
+        `section` nor any prior section defines a footer.
+
+        All footers are resolved in a single pass, rather than searching back through
+        the prior sections once for each section. No footer definition is added.
+        """
+        sections = list(self)
+        yield from zip(sections, _iter_effective(section.footer for section in sections))
+
+    def iter_effective_headers(self) -> Iterator[Tuple[Section, _Header | None]]:
+        """Generate a `(section, header)` pair for each section in this document.
+
+        `header` is the default |_Header| whose content appears in `section`. This is
+        `section.header` when that header has its own definition, otherwise the header of
+        the nearest prior section that has one. `header` is |None| when neither
+        `section` nor any prior section defines a header.
+
+        All headers are resolved in a single pass, rather than searching back through
+        the prior sections once for each section. No header definition is added.
+        """
+        sections = list(self)
+        yield from zip(sections, _iter_effective(section.header for section in sections))
+
+    def pluck(self, name: str) -> List[Any]:
+        """List of the value of section property `name` for each section, in document order.
+
+        `name` is the name of a |Section| page-setup property, like "page_width" or
+        "start_type". Each value is equal to that of the property but is read directly
+        from the section's `w:sectPr` element, without constructing a |Section| object.
+        Raises |ValueError| when `name` is not such a property.
+        """
+        getter = _sectPr_getters.get(name)
+        if getter is None:
+            raise ValueError(f"'{name}' is not a Section page-setup property")
+        return [getter(sectPr) for sectPr in self._document_elm.sectPr_lst]
+
+    def snapshot(self) -> List[SectionSnapshot]:
+        """List of |SectionSnapshot| for each section in this document, in document order.
+
+        Page settings and effective headers and footers for all sections are gathered in
+        a single pass over the sections. Code needing several of these values for each
+        section can use this rather than making a separate pass for each. No header or
+        footer definition is added.
+        """
+        document_part = self._document_part
+        sectPrs = self._document_elm.sectPr_lst
+        sections = [Section(sectPr, document_part) for sectPr in sectPrs]
+        snapshots: List[SectionSnapshot] = []
+        for sectPr, section, header, footer in zip(
+            sectPrs,
+            sections,
+            _iter_effective(section.header for section in sections),
+            _iter_effective(section.footer for section in sections),
+        ):
+            page_settings = sectPr.page_settings
+            snapshots.append(
+                SectionSnapshot(
+                    section=section,
+                    header=header,
+                    footer=footer,
+                    orientation=page_settings.orientation,
+                    page_width=page_settings.page_width,
+                    page_height=page_settings.page_height,
+                    top_margin=page_settings.top_margin,
+                    bottom_margin=page_settings.bottom_margin,
+                    left_margin=page_settings.left_margin,
+                    right_margin=page_settings.right_margin,
+                    gutter=page_settings.gutter,
+                    header_distance=page_settings.header_distance,
+                    footer_distance=page_settings.footer_distance,
+                )
+            )
+        return snapshots
 
 
 class _BaseHeaderFooter(BlockItemContainer):
     """Base class for header and footer classes."""
 
+    __slots__ = ("_sectPr", "_document_part", "_hdrftr_index")
+
     def __init__(
         self,
         sectPr: CT_SectPr,
@@ -316,8 +474,8 @@ class _BaseHeaderFooter(BlockItemContainer):
     @is_linked_to_previous.setter
     def is_linked_to_previous(self, value: bool) -> None:
         new_state = bool(value)
-        # ---do nothing when value is not being changed---
-        if new_state == self.is_linked_to_previous:
+        # ---do nothing when value is not being changed, "linked" means no definition---
+        if new_state != self._has_definition:
             return
         if new_state is True:
             self._drop_definition()
@@ -339,11 +497,6 @@ class _BaseHeaderFooter(BlockItemContainer):
         """Return newly-added header/footer part."""
         raise NotImplementedError("must be implemented by each subclass")
 
-    @property
-    def _definition(self) -> HeaderPart | FooterPart:
-        """|HeaderPart| or |FooterPart| object containing header/footer content."""
-        raise NotImplementedError("must be implemented by each subclass")
-
     def _drop_definition(self) -> None:
         """Remove header/footer part containing the definition of this header/footer."""
         raise NotImplementedError("must be implemented by each subclass")
@@ -356,35 +509,73 @@ class _BaseHeaderFooter(BlockItemContainer):
     def _get_or_add_definition(self) -> HeaderPart | FooterPart:
         """Return HeaderPart or FooterPart object for this section.
 
-        If this header/footer inherits its content, the part for the prior header/footer
-        is returned; this process continue recursively until a definition is found. If
-        the definition cannot be inherited (because the header/footer belongs to the
-        first section), a new definition is added for that first section and then
-        returned.
+        If this header/footer inherits its content, the part for the nearest prior
+        header/footer having a definition is returned. If the definition cannot be
+        inherited (because no prior section has one), a new definition is added for the
+        first section and then returned.
+        """
+        own_sectPr, get_reference = self._sectPr, self._get_reference
+
+        # -- the reference found is used directly to get the part, so each `w:sectPr` is
+        # -- searched just once --
+        reference = get_reference(own_sectPr)
+        if reference is not None:
+            return self._get_definition(reference.rId)
+
+        # -- otherwise the definition is inherited. The document's `w:sectPr` sequence is
+        # -- computed once and prior sections are searched by position, nearest first,
+        # -- looking only at their `w:sectPr` element.
+        sectPrs = cast("CT_Document", self._document_part.element).sectPr_lst
+        try:
+            prior_sectPrs = sectPrs[: sectPrs.index(own_sectPr)]
+        except ValueError:
+            # -- this `w:sectPr` is no longer in the document (its section break was
+            # -- removed after this proxy was created), so fall back to the sectPrs that
+            # -- precede it in the tree it now belongs to, if any.
+            prior_sectPrs = self._detached_prior_sectPrs()
+        for sectPr in reversed(prior_sectPrs):
+            reference = get_reference(sectPr)
+            if reference is not None:
+                return self._get_definition(reference.rId)
+
+        # -- no prior section defines it, so a definition is added to the first section --
+        first_sectPr = prior_sectPrs[0] if prior_sectPrs else own_sectPr
+        return self._headerfooter_for(first_sectPr)._add_definition()
+
+    def _detached_prior_sectPrs(self) -> List[CT_SectPr]:
+        """`w:sectPr` elements preceding this one's, in document order.
+
+        Only used when this header/footer's `w:sectPr` is not in the document's
+        `w:sectPr` sequence; the `.preceding_sectPr` chain is followed instead.
         """
-        # ---note this method is called recursively to access inherited definitions---
-        # ---case-1: definition is not inherited---
-        if self._has_definition:
-            return self._definition
-        # ---case-2: definition is inherited and belongs to second-or-later section---
-        prior_headerfooter = self._prior_headerfooter
-        if prior_headerfooter:
-            return prior_headerfooter._get_or_add_definition()
-        # ---case-3: definition is inherited, but belongs to first section---
-        return self._add_definition()
+        prior_sectPrs: List[CT_SectPr] = []
+        sectPr = self._sectPr.preceding_sectPr
+        while sectPr is not None:
+            prior_sectPrs.append(sectPr)
+            sectPr = sectPr.preceding_sectPr
+        return prior_sectPrs[::-1]
+
+    def _get_definition(self, rId: str) -> HeaderPart | FooterPart:
+        """|HeaderPart| or |FooterPart| object related to the document part by `rId`."""
+        raise NotImplementedError("must be implemented by each subclass")
+
+    def _get_reference(self, sectPr: CT_SectPr) -> CT_HdrFtrRef | None:
+        """`w:headerReference` or `w:footerReference` of this type in `sectPr`, if any."""
+        raise NotImplementedError("must be implemented by each subclass")
 
     @property
     def _has_definition(self) -> bool:
         """True if this header/footer has a related part containing its definition."""
-        raise NotImplementedError("must be implemented by each subclass")
+        return self._get_reference(self._sectPr) is not None
 
-    @property
-    def _prior_headerfooter(self) -> _Header | _Footer | None:
-        """|_Header| or |_Footer| proxy on prior sectPr element.
+    def _headerfooter_for(self, sectPr: CT_SectPr) -> _BaseHeaderFooter:
+        """Header/footer of this same type belonging to the section of `sectPr`.
 
-        Returns None if this is first section.
+        This header/footer itself is returned when `sectPr` is its own.
         """
-        raise NotImplementedError("must be implemented by each subclass")
+        if sectPr is self._sectPr:
+            return self
+        return type(self)(sectPr, self._document_part, self._hdrftr_index)
 
 
 class _Footer(_BaseHeaderFooter):
@@ -397,40 +588,26 @@ class _Footer(_BaseHeaderFooter):
     leave an empty paragraph above the newly added one.
     """
 
+    __slots__ = ()
+
     def _add_definition(self) -> FooterPart:
         """Return newly-added footer part."""
         footer_part, rId = self._document_part.add_footer_part()
         self._sectPr.add_footerReference(self._hdrftr_index, rId)
         return footer_part
 
-    @property
-    def _definition(self):
-        """|FooterPart| object containing content of this footer."""
-        footerReference = self._sectPr.get_footerReference(self._hdrftr_index)
-        # -- currently this is never called when `._has_definition` evaluates False --
-        assert footerReference is not None
-        return self._document_part.footer_part(footerReference.rId)
-
     def _drop_definition(self):
         """Remove footer definition (footer part) associated with this section."""
         rId = self._sectPr.remove_footerReference(self._hdrftr_index)
         self._document_part.drop_rel(rId)
 
-    @property
-    def _has_definition(self) -> bool:
-        """True if a footer is defined for this section."""
-        footerReference = self._sectPr.get_footerReference(self._hdrftr_index)
-        return footerReference is not None
+    def _get_definition(self, rId: str) -> FooterPart:
+        """|FooterPart| object containing the footer content related by `rId`."""
+        return self._document_part.footer_part(rId)
 
-    @property
-    def _prior_headerfooter(self):
-        """|_Footer| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
-        return (
-            None
-            if preceding_sectPr is None
-            else _Footer(preceding_sectPr, self._document_part, self._hdrftr_index)
-        )
+    def _get_reference(self, sectPr: CT_SectPr) -> CT_HdrFtrRef | None:
+        """`w:footerReference` of this footer's type in `sectPr`, or None if not present."""
+        return sectPr.get_footerReference(self._hdrftr_index)
 
 
 class _Header(_BaseHeaderFooter):
@@ -443,37 +620,39 @@ class _Header(_BaseHeaderFooter):
     leave an empty paragraph above the newly added one.
     """
 
+    __slots__ = ()
+
     def _add_definition(self):
         """Return newly-added header part."""
         header_part, rId = self._document_part.add_header_part()
         self._sectPr.add_headerReference(self._hdrftr_index, rId)
         return header_part
 
-    @property
-    def _definition(self):
-        """|HeaderPart| object containing content of this header."""
-        headerReference = self._sectPr.get_headerReference(self._hdrftr_index)
-        # -- currently this is never called when `._has_definition` evaluates False --
-        assert headerReference is not None
-        return self._document_part.header_part(headerReference.rId)
-
     def _drop_definition(self):
         """Remove header definition associated with this section."""
         rId = self._sectPr.remove_headerReference(self._hdrftr_index)
         self._document_part.drop_header_part(rId)
 
-    @property
-    def _has_definition(self) -> bool:
-        """True if a header is explicitly defined for this section."""
-        headerReference = self._sectPr.get_headerReference(self._hdrftr_index)
-        return headerReference is not None
+    def _get_definition(self, rId: str) -> HeaderPart:
+        """|HeaderPart| object containing the header content related by `rId`."""
+        return self._document_part.header_part(rId)
 
-    @property
-    def _prior_headerfooter(self):
-        """|_Header| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
-        return (
-            None
-            if preceding_sectPr is None
-            else _Header(preceding_sectPr, self._document_part, self._hdrftr_index)
-        )
+    def _get_reference(self, sectPr: CT_SectPr) -> CT_HdrFtrRef | None:
+        """`w:headerReference` of this header's type in `sectPr`, or None if not present."""
+        return sectPr.get_headerReference(self._hdrftr_index)
+
+
+_HeaderOrFooter = TypeVar("_HeaderOrFooter", bound=_BaseHeaderFooter)
+
+
+def _iter_effective(hdrftrs: Iterable[_HeaderOrFooter]) -> Iterator[_HeaderOrFooter | None]:
+    """Generate the effective header or footer for each of `hdrftrs`, in order.
+
+    This is the header/footer itself when it has its own definition, otherwise the
+    nearest prior one that has a definition, or |None| when there is no such prior one.
+    """
+    effective = None
+    for hdrftr in hdrftrs:
+        if not hdrftr.is_linked_to_previous:
+            effective = hdrftr
+        yield effective
@@ -4,13 +4,37 @@ from __future__ import annotations
 
 from typing import cast
 
-from docx.oxml.document import CT_Body
+import pytest
+
+from docx.oxml.document import CT_Body, CT_Document
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
 
 from ..unitutil.cxml import element
 
 
+class DescribeCT_Document:
+    """Unit-test suite for selected units of `docx.oxml.document.CT_Document`."""
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_value"),
+        [
+            ("w:document/w:body", 0),
+            ("w:document/w:body/w:sectPr", 1),
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:tbl,w:p/w:pPr/w:sectPr,w:sectPr)", 3),
+            # -- a `w:sectPr` not directly accessible from the body is not counted --
+            ("w:document/w:body/(w:p/w:r/w:sectPr,w:sectPr)", 1),
+        ],
+    )
+    def it_knows_how_many_sectPr_elements_it_contains(self, cxml: str, expected_value: int):
+        document = cast(CT_Document, element(cxml))
+
+        sectPr_count = document.sectPr_count
+
+        assert sectPr_count == expected_value
+        assert sectPr_count == len(document.sectPr_lst)
+
+
 class DescribeCT_Body:
     """Unit-test suite for selected units of `docx.oxml.document.CT_Body`."""
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import List, cast
 
-from docx.oxml.section import CT_HdrFtr
+import pytest
+
+from docx.enum.section import WD_HEADER_FOOTER
+from docx.oxml.section import CT_HdrFtr, CT_SectPr, PageSettings
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
 
@@ -17,3 +20,114 @@ class DescribeCT_HdrFtr:
     def it_knows_its_inner_content_block_item_elements(self):
         hdr = cast(CT_HdrFtr, element("w:hdr/(w:tbl,w:tbl,w:p)"))
         assert [type(e) for e in hdr.inner_content_elements] == [CT_Tbl, CT_Tbl, CT_P]
+
+
+class DescribeCT_SectPr:
+    """Unit-test suite for selected units of `docx.oxml.section.CT_SectPr`."""
+
+    @pytest.mark.parametrize(
+        ("cxml", "type_", "expected_idx"),
+        [
+            ("w:sectPr", WD_HEADER_FOOTER.PRIMARY, None),
+            ("w:sectPr/w:footerReference{w:type=default}", WD_HEADER_FOOTER.PRIMARY, None),
+            ("w:sectPr/w:headerReference{w:type=default}", WD_HEADER_FOOTER.PRIMARY, 0),
+            ("w:sectPr/w:headerReference{w:type=even}", WD_HEADER_FOOTER.FIRST_PAGE, None),
+            (
+                "w:sectPr/(w:headerReference{w:type=even},w:headerReference{w:type=first},"
+                "w:headerReference{w:type=first})",
+                WD_HEADER_FOOTER.FIRST_PAGE,
+                1,
+            ),
+        ],
+    )
+    def it_can_get_its_headerReference_of_a_type(
+        self, cxml: str, type_: WD_HEADER_FOOTER, expected_idx: int | None
+    ):
+        sectPr = cast(CT_SectPr, element(cxml))
+
+        headerReference = sectPr.get_headerReference(type_)
+
+        assert headerReference is (None if expected_idx is None else sectPr[expected_idx])
+
+    @pytest.mark.parametrize(
+        ("cxml", "type_", "expected_idx"),
+        [
+            ("w:sectPr", WD_HEADER_FOOTER.PRIMARY, None),
+            ("w:sectPr/w:headerReference{w:type=default}", WD_HEADER_FOOTER.PRIMARY, None),
+            ("w:sectPr/w:footerReference{w:type=default}", WD_HEADER_FOOTER.PRIMARY, 0),
+            ("w:sectPr/w:footerReference{w:type=first}", WD_HEADER_FOOTER.EVEN_PAGE, None),
+            (
+                "w:sectPr/(w:footerReference{w:type=first},w:footerReference{w:type=even},"
+                "w:footerReference{w:type=even})",
+                WD_HEADER_FOOTER.EVEN_PAGE,
+                1,
+            ),
+        ],
+    )
+    def it_can_get_its_footerReference_of_a_type(
+        self, cxml: str, type_: WD_HEADER_FOOTER, expected_idx: int | None
+    ):
+        sectPr = cast(CT_SectPr, element(cxml))
+
+        footerReference = sectPr.get_footerReference(type_)
+
+        assert footerReference is (None if expected_idx is None else sectPr[expected_idx])
+
+    @pytest.mark.parametrize(
+        "cxml",
+        [
+            "w:sectPr",
+            "w:sectPr/w:pgSz{w:w=12240,w:h=15840,w:orient=landscape}",
+            "w:sectPr/w:pgMar{w:top=1440,w:bottom=720,w:left=1800,w:right=360,w:gutter=0"
+            ",w:header=708,w:footer=709}",
+            "w:sectPr/(w:pgSz{w:w=11906},w:pgMar{w:left=1134})",
+        ],
+    )
+    def it_knows_its_page_settings(self, cxml: str):
+        sectPr = cast(CT_SectPr, element(cxml))
+
+        page_settings = sectPr.page_settings
+
+        assert page_settings == PageSettings(
+            orientation=sectPr.orientation,
+            page_width=sectPr.page_width,
+            page_height=sectPr.page_height,
+            top_margin=sectPr.top_margin,
+            bottom_margin=sectPr.bottom_margin,
+            left_margin=sectPr.left_margin,
+            right_margin=sectPr.right_margin,
+            gutter=sectPr.gutter,
+            header_distance=sectPr.header,
+            footer_distance=sectPr.footer,
+        )
+
+    @pytest.mark.parametrize(
+        ("cxml", "sectPr_idx", "expected_idx"),
+        [
+            ("w:document/w:body/w:sectPr", 0, None),
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)", 1, 0),
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:tbl,w:p/w:pPr,w:sectPr)", 1, 0),
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)", 1, 0),
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)", 2, 1),
+            ("w:document/w:body/(w:p,w:p/w:pPr/w:sectPr,w:sectPr)", 0, None),
+            ("w:document/(w:sectPr,w:sectPr)", 1, 0),
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:tbl/w:tr/w:tc/w:p/w:pPr/w:sectPr)", 1, 0),
+            # -- a nested sectPr anywhere before this one is the preceding sectPr --
+            (
+                "w:document/w:body/(w:p/w:pPr/w:sectPr,w:tbl/w:tr/w:tc/w:p/w:pPr/w:sectPr"
+                ",w:sectPr)",
+                2,
+                1,
+            ),
+            ("w:document/w:body/(w:sdt/w:sdtContent/w:p/w:pPr/w:sectPr,w:sectPr)", 1, 0),
+        ],
+    )
+    def it_knows_the_sectPr_that_precedes_it(
+        self, cxml: str, sectPr_idx: int, expected_idx: int | None
+    ):
+        sectPrs = cast(List[CT_SectPr], element(cxml).xpath("//w:sectPr"))
+        sectPr = sectPrs[sectPr_idx]
+
+        preceding_sectPr = sectPr.preceding_sectPr
+
+        assert preceding_sectPr is (None if expected_idx is None else sectPrs[expected_idx])
@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from typing import cast
+import collections.abc
+from typing import List, cast
 
 import pytest
 
@@ -42,6 +43,11 @@ class DescribeSections:
         sections = Sections(document_elm, document_part_)
         assert len(sections) == 2
 
+    def it_is_a_sequence_of_sections(self, document_part_: Mock):
+        document_elm = cast(CT_Document, element("w:document/w:body/w:sectPr"))
+        sections = Sections(document_elm, document_part_)
+        assert isinstance(sections, collections.abc.Sequence)
+
     def it_can_iterate_over_its_Section_instances(
         self, Section_: Mock, section_: Mock, document_part_: Mock
     ):
@@ -103,6 +109,150 @@ class DescribeSections:
         ]
         assert section_lst == [section_, section_]
 
+    @pytest.mark.parametrize(
+        ("document_cxml", "expected_idxs"),
+        [
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)", [None, None]),
+            (
+                "w:document/w:body/(w:p/w:pPr/w:sectPr/w:headerReference{w:type=default},"
+                "w:sectPr)",
+                [0, 0],
+            ),
+            (
+                "w:document/w:body/(w:p/w:pPr/w:sectPr,"
+                "w:p/w:pPr/w:sectPr/w:headerReference{w:type=default},w:sectPr)",
+                [None, 1, 1],
+            ),
+            (
+                "w:document/w:body/(w:p/w:pPr/w:sectPr/w:headerReference{w:type=default},"
+                "w:p/w:pPr/w:sectPr,w:sectPr/w:headerReference{w:type=default})",
+                [0, 0, 2],
+            ),
+            # -- only the default header is considered --
+            (
+                "w:document/w:body/(w:p/w:pPr/w:sectPr/w:headerReference{w:type=even},"
+                "w:sectPr)",
+                [None, None],
+            ),
+        ],
+    )
+    def it_can_iterate_the_effective_header_of_each_section(
+        self, document_cxml: str, expected_idxs: List[int | None], document_part_: Mock
+    ):
+        document_elm = cast(CT_Document, element(document_cxml))
+        sectPrs = document_elm.sectPr_lst
+        sections = Sections(document_elm, document_part_)
+
+        pairs = list(sections.iter_effective_headers())
+
+        assert [section._sectPr for section, _ in pairs] == sectPrs
+        assert [
+            None if header is None else sectPrs.index(header._sectPr) for _, header in pairs
+        ] == expected_idxs
+        document_part_.add_header_part.assert_not_called()
+
+    def it_can_iterate_the_effective_footer_of_each_section(self, document_part_: Mock):
+        document_elm = cast(
+            CT_Document,
+            element(
+                "w:document/w:body/(w:p/w:pPr/w:sectPr,"
+                "w:p/w:pPr/w:sectPr/w:footerReference{w:type=default},w:sectPr)"
+            ),
+        )
+        sectPrs = document_elm.sectPr_lst
+        sections = Sections(document_elm, document_part_)
+
+        pairs = list(sections.iter_effective_footers())
+
+        assert [section._sectPr for section, _ in pairs] == sectPrs
+        section, footer = pairs[1]
+        assert pairs[0][1] is None
+        assert footer is section.footer
+        assert pairs[2][1] is footer
+        document_part_.add_footer_part.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "bottom_margin",
+            "different_first_page_header_footer",
+            "footer_distance",
+            "gutter",
+            "header_distance",
+            "left_margin",
+            "orientation",
+            "page_height",
+            "page_width",
+            "right_margin",
+            "start_type",
+            "top_margin",
+        ],
+    )
+    def it_can_pluck_a_page_setup_value_from_each_section(self, name: str, document_part_: Mock):
+        document_elm = cast(
+            CT_Document,
+            element(
+                "w:document/w:body/("
+                "w:p/w:pPr/w:sectPr/(w:type{w:val=oddPage},w:pgSz{w:w=12240,w:h=15840}"
+                ",w:pgMar{w:top=1440,w:right=1800,w:bottom=720,w:left=900,w:header=360"
+                ",w:footer=540,w:gutter=180},w:titlePg)"
+                ",w:sectPr/w:pgSz{w:orient=landscape}"
+                ")"
+            ),
+        )
+        sections = Sections(document_elm, document_part_)
+
+        values = sections.pluck(name)
+
+        assert values == [getattr(section, name) for section in sections]
+        assert values[0] != values[1]
+
+    def but_it_raises_on_pluck_of_an_unknown_property(self, document_part_: Mock):
+        document_elm = cast(CT_Document, element("w:document/w:body/w:sectPr"))
+        sections = Sections(document_elm, document_part_)
+
+        with pytest.raises(ValueError, match="'header' is not a Section page-setup property"):
+            sections.pluck("header")
+
+    def it_can_take_a_snapshot_of_its_sections(self, document_part_: Mock):
+        document_elm = cast(
+            CT_Document,
+            element(
+                "w:document/w:body/("
+                "w:p/w:pPr/w:sectPr/(w:headerReference{w:type=default},w:pgSz{w:w=12240,w:h=15840}"
+                ",w:pgMar{w:top=1440,w:right=1800,w:bottom=720,w:left=900,w:header=360"
+                ",w:footer=540,w:gutter=180})"
+                ",w:sectPr/(w:footerReference{w:type=default},w:pgSz{w:orient=landscape})"
+                ")"
+            ),
+        )
+        sectPrs = document_elm.sectPr_lst
+        sections = Sections(document_elm, document_part_)
+
+        snapshots = sections.snapshot()
+
+        assert [snapshot.section._sectPr for snapshot in snapshots] == sectPrs
+        first, second = snapshots
+        assert first.header is first.section.header
+        assert second.header is first.header
+        assert first.footer is None
+        assert second.footer is second.section.footer
+        assert first[3:] == (
+            WD_ORIENTATION.PORTRAIT,
+            Inches(8.5),
+            Inches(11),
+            Inches(1),
+            Inches(0.5),
+            Inches(0.625),
+            Inches(1.25),
+            Inches(0.125),
+            Inches(0.25),
+            Inches(0.375),
+        )
+        assert second[3:] == (WD_ORIENTATION.LANDSCAPE,) + (None,) * 9
+        document_part_.add_header_part.assert_not_called()
+        document_part_.add_footer_part.assert_not_called()
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -230,6 +380,9 @@ class DescribeSection:
             sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY
         )
         assert footer is footer_
+        # -- the same object is returned on subsequent access --
+        assert section.footer is footer
+        assert _Footer_.call_count == 1
 
     def it_provides_access_to_its_default_header(
         self, document_part_: Mock, _Header_: Mock, header_: Mock
@@ -244,6 +397,9 @@ class DescribeSection:
             sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY
         )
         assert header is header_
+        # -- the same object is returned on subsequent access --
+        assert section.header is header
+        assert _Header_.call_count == 1
 
     def it_can_iterate_its_inner_content(self):
         document = Document(test_file("sct-inner-content.docx"))
@@ -636,74 +792,146 @@ class Describe_BaseHeaderFooter:
         assert hdr_elm is hdr
 
     def it_gets_the_definition_when_it_has_one(
-        self, _has_definition_prop_: Mock, _definition_prop_: Mock, header_part_: Mock
+        self, _get_reference_: Mock, _get_definition_: Mock, header_part_: Mock
     ):
-        _has_definition_prop_.return_value = True
-        _definition_prop_.return_value = header_part_
+        sectPr = element("w:sectPr/w:headerReference{w:type=default,r:id=rId1}")
+        _get_reference_.return_value = sectPr[0]
+        _get_definition_.return_value = header_part_
         header = _BaseHeaderFooter(
-            None, None, None  # pyright: ignore[reportGeneralTypeIssues]
+            sectPr, None, None  # pyright: ignore[reportGeneralTypeIssues]
         )
 
         header_part = header._get_or_add_definition()
 
+        assert _get_reference_.call_args_list == [call(header, sectPr)]
+        _get_definition_.assert_called_once_with(header, "rId1")
         assert header_part is header_part_
 
     def but_it_gets_the_prior_definition_when_it_is_linked(
         self,
-        _has_definition_prop_: Mock,
-        _prior_headerfooter_prop_: Mock,
-        prior_headerfooter_: Mock,
+        _get_reference_: Mock,
+        _get_definition_: Mock,
+        _headerfooter_for_: Mock,
+        document_part_: Mock,
         header_part_: Mock,
     ):
-        _has_definition_prop_.return_value = False
-        _prior_headerfooter_prop_.return_value = prior_headerfooter_
-        prior_headerfooter_._get_or_add_definition.return_value = header_part_
+        document_elm = element(
+            "w:document/w:body/("
+            "w:p/w:pPr/w:sectPr/w:headerReference{w:type=default,r:id=rId6}"
+            ",w:p/w:pPr/w:sectPr"
+            ",w:sectPr"
+            ")"
+        )
+        sectPrs = document_elm.xpath("//w:sectPr")
+        document_part_.element = document_elm
+        _get_reference_.side_effect = [None, None, sectPrs[0][0]]
+        _get_definition_.return_value = header_part_
         header = _BaseHeaderFooter(
-            None, None, None  # pyright: ignore[reportGeneralTypeIssues]
+            sectPrs[2], document_part_, None  # pyright: ignore[reportGeneralTypeIssues]
         )
 
         header_part = header._get_or_add_definition()
 
-        prior_headerfooter_._get_or_add_definition.assert_called_once_with()
+        assert _get_reference_.call_args_list == [
+            call(header, sectPrs[2]),
+            call(header, sectPrs[1]),
+            call(header, sectPrs[0]),
+        ]
+        _get_definition_.assert_called_once_with(header, "rId6")
+        _headerfooter_for_.assert_not_called()
         assert header_part is header_part_
 
     def and_it_adds_a_definition_when_it_is_linked_and_the_first_section(
         self,
-        _has_definition_prop_: Mock,
-        _prior_headerfooter_prop_: Mock,
+        _get_reference_: Mock,
+        _headerfooter_for_: Mock,
+        prior_headerfooter_: Mock,
+        document_part_: Mock,
+        header_part_: Mock,
+    ):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)")
+        sectPrs = document_elm.xpath("//w:sectPr")
+        document_part_.element = document_elm
+        _get_reference_.return_value = None
+        _headerfooter_for_.return_value = prior_headerfooter_
+        prior_headerfooter_._add_definition.return_value = header_part_
+        header = _BaseHeaderFooter(
+            sectPrs[1], document_part_, None  # pyright: ignore[reportGeneralTypeIssues]
+        )
+
+        header_part = header._get_or_add_definition()
+
+        assert _get_reference_.call_args_list == [
+            call(header, sectPrs[1]),
+            call(header, sectPrs[0]),
+        ]
+        _headerfooter_for_.assert_called_once_with(header, sectPrs[0])
+        prior_headerfooter_._add_definition.assert_called_once_with()
+        assert header_part is header_part_
+
+    def and_it_adds_a_definition_when_its_sectPr_is_no_longer_in_the_document(
+        self,
+        _get_reference_: Mock,
         _add_definition_: Mock,
+        document_part_: Mock,
         header_part_: Mock,
     ):
-        _has_definition_prop_.return_value = False
-        _prior_headerfooter_prop_.return_value = None
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)")
+        sectPr = element("w:sectPr")
+        document_part_.element = document_elm
+        _get_reference_.return_value = None
         _add_definition_.return_value = header_part_
         header = _BaseHeaderFooter(
-            None, None, None  # pyright: ignore[reportGeneralTypeIssues]
+            sectPr, document_part_, None  # pyright: ignore[reportGeneralTypeIssues]
         )
 
         header_part = header._get_or_add_definition()
 
+        assert _get_reference_.call_args_list == [call(header, sectPr)]
         _add_definition_.assert_called_once_with(header)
         assert header_part is header_part_
 
+    def it_provides_access_to_the_header_or_footer_for_a_sectPr_to_help(
+        self, document_part_: Mock
+    ):
+        document_elm = element("w:document/(w:sectPr,w:sectPr)")
+        prior_sectPr, sectPr = document_elm.xpath("//w:sectPr")
+        footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
+
+        prior_footer = footer._headerfooter_for(prior_sectPr)
+
+        assert isinstance(prior_footer, _Footer)
+        assert prior_footer._sectPr is prior_sectPr
+        assert prior_footer._document_part is document_part_
+        assert prior_footer._hdrftr_index == WD_HEADER_FOOTER.EVEN_PAGE
+        assert footer._headerfooter_for(sectPr) is footer
+
     # -- fixture -----------------------------------------------------
 
     @pytest.fixture
     def _add_definition_(self, request: FixtureRequest):
         return method_mock(request, _BaseHeaderFooter, "_add_definition")
 
-    @pytest.fixture
-    def _definition_prop_(self, request: FixtureRequest):
-        return property_mock(request, _BaseHeaderFooter, "_definition")
-
     @pytest.fixture
     def _drop_definition_(self, request: FixtureRequest):
         return method_mock(request, _BaseHeaderFooter, "_drop_definition")
 
+    @pytest.fixture
+    def document_part_(self, request: FixtureRequest):
+        return instance_mock(request, DocumentPart)
+
+    @pytest.fixture
+    def _get_definition_(self, request: FixtureRequest):
+        return method_mock(request, _BaseHeaderFooter, "_get_definition")
+
     @pytest.fixture
     def _get_or_add_definition_(self, request: FixtureRequest):
         return method_mock(request, _BaseHeaderFooter, "_get_or_add_definition")
 
+    @pytest.fixture
+    def _get_reference_(self, request: FixtureRequest):
+        return method_mock(request, _BaseHeaderFooter, "_get_reference")
+
     @pytest.fixture
     def _has_definition_prop_(self, request: FixtureRequest):
         return property_mock(request, _BaseHeaderFooter, "_has_definition")
@@ -713,12 +941,12 @@ class Describe_BaseHeaderFooter:
         return instance_mock(request, HeaderPart)
 
     @pytest.fixture
-    def prior_headerfooter_(self, request: FixtureRequest):
-        return instance_mock(request, _BaseHeaderFooter)
+    def _headerfooter_for_(self, request: FixtureRequest):
+        return method_mock(request, _BaseHeaderFooter, "_headerfooter_for")
 
     @pytest.fixture
-    def _prior_headerfooter_prop_(self, request: FixtureRequest):
-        return property_mock(request, _BaseHeaderFooter, "_prior_headerfooter")
+    def prior_headerfooter_(self, request: FixtureRequest):
+        return instance_mock(request, _BaseHeaderFooter)
 
 
 class Describe_Footer:
@@ -742,11 +970,12 @@ class Describe_Footer:
     def it_provides_access_to_its_footer_part_to_help(
         self, document_part_: Mock, footer_part_: Mock
     ):
-        sectPr = element("w:sectPr/w:footerReference{w:type=even,r:id=rId3}")
         document_part_.footer_part.return_value = footer_part_
-        footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
+        footer = _Footer(
+            None, document_part_, WD_HEADER_FOOTER.EVEN_PAGE  # pyright: ignore[reportGeneralTypeIssues]
+        )
 
-        footer_part = footer._definition
+        footer_part = footer._get_definition("rId3")
 
         document_part_.footer_part.assert_called_once_with("rId3")
         assert footer_part is footer_part_
@@ -774,30 +1003,27 @@ class Describe_Footer:
 
         assert has_definition is expected_value
 
-    def it_provides_access_to_the_prior_Footer_to_help(
-        self, request: FixtureRequest, document_part_: Mock, footer_: Mock
+    @pytest.mark.parametrize(
+        ("sectPr_cxml", "type_", "expected_idx"),
+        [
+            ("w:sectPr", WD_HEADER_FOOTER.PRIMARY, None),
+            ("w:sectPr/w:headerReference{w:type=default}", WD_HEADER_FOOTER.PRIMARY, None),
+            (
+                "w:sectPr/(w:footerReference{w:type=even},w:footerReference{w:type=first})",
+                WD_HEADER_FOOTER.FIRST_PAGE,
+                1,
+            ),
+        ],
+    )
+    def it_can_get_its_footerReference_in_a_sectPr_to_help(
+        self, sectPr_cxml: str, type_: WD_HEADER_FOOTER, expected_idx: int | None
     ):
-        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
-        prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
-        footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
-        # ---mock must occur after construction of "real" footer---
-        _Footer_ = class_mock(request, "docx.section._Footer", return_value=footer_)
-
-        prior_footer = footer._prior_headerfooter
-
-        _Footer_.assert_called_once_with(
-            prior_sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE
-        )
-        assert prior_footer is footer_
-
-    def but_it_returns_None_when_its_the_first_footer(self):
-        doc_elm = cast(CT_Document, element("w:document/w:sectPr"))
-        sectPr = doc_elm[0]
-        footer = _Footer(sectPr, None, None)
+        sectPr = cast(CT_SectPr, element(sectPr_cxml))
+        footer = _Footer(None, None, type_)  # pyright: ignore[reportGeneralTypeIssues]
 
-        prior_footer = footer._prior_headerfooter
+        footerReference = footer._get_reference(sectPr)
 
-        assert prior_footer is None
+        assert footerReference is (None if expected_idx is None else sectPr[expected_idx])
 
     # -- fixtures ----------------------------------------------------
 
@@ -805,10 +1031,6 @@ class Describe_Footer:
     def document_part_(self, request: FixtureRequest):
         return instance_mock(request, DocumentPart)
 
-    @pytest.fixture
-    def footer_(self, request: FixtureRequest):
-        return instance_mock(request, _Footer)
-
     @pytest.fixture
     def footer_part_(self, request: FixtureRequest):
         return instance_mock(request, FooterPart)
@@ -833,11 +1055,12 @@ class Describe_Header:
     def it_provides_access_to_its_header_part_to_help(
         self, document_part_: Mock, header_part_: Mock
     ):
-        sectPr = element("w:sectPr/w:headerReference{w:type=default,r:id=rId8}")
         document_part_.header_part.return_value = header_part_
-        header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY)
+        header = _Header(
+            None, document_part_, WD_HEADER_FOOTER.PRIMARY  # pyright: ignore[reportGeneralTypeIssues]
+        )
 
-        header_part = header._definition
+        header_part = header._get_definition("rId8")
 
         document_part_.header_part.assert_called_once_with("rId8")
         assert header_part is header_part_
@@ -865,30 +1088,27 @@ class Describe_Header:
 
         assert has_definition is expected_value
 
-    def it_provides_access_to_the_prior_Header_to_help(
-        self, request, document_part_: Mock, header_: Mock
+    @pytest.mark.parametrize(
+        ("sectPr_cxml", "type_", "expected_idx"),
+        [
+            ("w:sectPr", WD_HEADER_FOOTER.PRIMARY, None),
+            ("w:sectPr/w:footerReference{w:type=default}", WD_HEADER_FOOTER.PRIMARY, None),
+            (
+                "w:sectPr/(w:headerReference{w:type=even},w:headerReference{w:type=default})",
+                WD_HEADER_FOOTER.PRIMARY,
+                1,
+            ),
+        ],
+    )
+    def it_can_get_its_headerReference_in_a_sectPr_to_help(
+        self, sectPr_cxml: str, type_: WD_HEADER_FOOTER, expected_idx: int | None
     ):
-        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
-        prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
-        header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY)
-        # ---mock must occur after construction of "real" header---
-        _Header_ = class_mock(request, "docx.section._Header", return_value=header_)
-
-        prior_header = header._prior_headerfooter
-
-        _Header_.assert_called_once_with(
-            prior_sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY
-        )
-        assert prior_header is header_
-
-    def but_it_returns_None_when_its_the_first_header(self):
-        doc_elm = element("w:document/w:sectPr")
-        sectPr = doc_elm[0]
-        header = _Header(sectPr, None, None)
+        sectPr = cast(CT_SectPr, element(sectPr_cxml))
+        header = _Header(None, None, type_)  # pyright: ignore[reportGeneralTypeIssues]
 
-        prior_header = header._prior_headerfooter
+        headerReference = header._get_reference(sectPr)
 
-        assert prior_header is None
+        assert headerReference is (None if expected_idx is None else sectPr[expected_idx])
 
     # -- fixtures-----------------------------------------------------
 
@@ -896,10 +1116,6 @@ class Describe_Header:
     def document_part_(self, request: FixtureRequest):
         return instance_mock(request, DocumentPart)
 
-    @pytest.fixture
-    def header_(self, request: FixtureRequest):
-        return instance_mock(request, _Header)
-
     @pytest.fixture
     def header_part_(self, request: FixtureRequest):
         return instance_mock(request, HeaderPart)